@@ -5,8 +5,21 @@ from __future__ import annotations
 import os
 import sys
 
-from lifetime_bot.runner import run_bot
-from lifetime_bot.utils.timing import get_target_utc_time, wait_until_utc
+from lifetime_bot.runner import (
+    BotFactory,
+    ReservationBot,
+    default_bot_factory,
+    record_skipped_run,
+    run_bot,
+)
+from lifetime_bot.utils.timing import (
+    get_lead_utc_time,
+    get_target_utc_time,
+    is_valid_day,
+    wait_until_utc,
+)
+
+PRELOGIN_LEAD_SECONDS = 30.0
 
 
 def main() -> int:
@@ -27,18 +40,46 @@ def main() -> int:
         success = run_bot()
         return 0 if success else 1
 
+    if not is_valid_day():
+        record_skipped_run("today is not a scheduled reservation day")
+        return 0
+
     local_time = os.getenv("TARGET_LOCAL_TIME", "10:00:00")
     timezone = os.getenv("TIMEZONE", "America/Chicago")
     target_time = get_target_utc_time(local_time, timezone)
     print(f"Target time: {local_time} {timezone} -> {target_time} UTC")
 
-    outcome = {"success": False}
+    bot_factory = _prepare_bot_factory()
+    wait_until_utc(
+        get_lead_utc_time(target_time, PRELOGIN_LEAD_SECONDS),
+        lambda: _prelogin(bot_factory),
+    )
+    success = wait_until_utc(target_time, lambda: run_bot(bot_factory=bot_factory))
+    return 0 if success else 1
+
+
+def _prepare_bot_factory() -> BotFactory:
+    """Build the bot before the scheduled wait so T0 only pays for API calls.
+
+    If construction fails here, fall back to building per attempt so the
+    runner records and reports the failure as usual.
+    """
+    factory = default_bot_factory()
+    try:
+        bot: ReservationBot = factory()
+    except Exception as exc:
+        print(f"Could not prepare bot before the scheduled wait: {exc}")
+        return factory
+    print("Bot prepared ahead of the scheduled wait.")
+    return lambda: bot
 
-    def _scheduled() -> None:
-        outcome["success"] = run_bot()
 
-    wait_until_utc(target_time, _scheduled)
-    return 0 if outcome["success"] else 1
+def _prelogin(bot_factory: BotFactory) -> None:
+    """Log in and find the class shortly before T0 so T0 goes straight to booking."""
+    try:
+        bot_factory().prepare_session()
+    except Exception as exc:
+        print(f"Could not log in ahead of the scheduled time: {exc}")
 
 
 if __name__ == "__main__":
@@ -13,6 +13,8 @@ from datetime import datetime, timezone
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from lifetime_bot.errors import LifetimeAPIError
 from lifetime_bot.models import ClassEvent, RegistrationResult, SessionTokens
@@ -25,15 +27,49 @@ from lifetime_bot.parsers import (
 
 SUBSCRIPTION_KEY = "924c03ce573d473793e184219a6a19bd"
 API_BASE = "https://api.lifetimefitness.com"
+SCHEDULE_CLASSES_URL = f"{API_BASE}/ux/web-schedules/v2/schedules/classes"
+EVENT_REGISTRATION_URL = f"{API_BASE}/ux/web-schedules/v2/events/{{event_id}}/registration"
+REGISTRATIONS_URL = f"{API_BASE}/sys/registrations/V3/ux/event"
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 20
+HTTP_CONNECT_RETRIES = 3
+HTTP_RETRY_BACKOFF_SECONDS = 0.3
 __all__ = [
     "API_BASE",
     "SUBSCRIPTION_KEY",
     "LifetimeAPIClient",
+    "create_http_session",
     "match_class",
     "extract_required_document_ids",
 ]
 
 
+def create_http_session() -> requests.Session:
+    """Create a keep-alive session whose pool is shared by login and API calls.
+
+    Only connection failures are retried at the transport layer: the request
+    never reached the server, so retrying is safe even for ``POST /event``.
+    Read and status retries stay off so a slow registration is never resent.
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(
+            total=HTTP_CONNECT_RETRIES,
+            connect=HTTP_CONNECT_RETRIES,
+            read=0,
+            status=0,
+            other=0,
+            backoff_factor=HTTP_RETRY_BACKOFF_SECONDS,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
 class LifetimeAPIClient:
     """Thin wrapper around the Life Time reservation endpoints."""
 
@@ -42,12 +78,12 @@ class LifetimeAPIClient:
         tokens: SessionTokens,
         *,
         session: requests.Session | None = None,
-        timeout: float = 30.0,
+        timeout: float | tuple[float, float] = 30.0,
     ) -> None:
         self.tokens = tokens
         self.timeout = timeout
         self._member_id: int | None = None
-        self.session = session or requests.Session()
+        self.session = session or create_http_session()
         headers = {
             "accept": "application/json, text/plain, */*",
             "accept-language": "en-US,en;q=0.9",
@@ -93,12 +129,14 @@ class LifetimeAPIClient:
         start: datetime,
         end: datetime,
         interests: list[str] | None = None,
+        date_iso: str | None = None,
     ) -> list[ClassEvent]:
         """Fetch classes at ``location`` between ``start`` and ``end`` (inclusive).
 
         ``start``/``end`` are passed as m/d/YYYY — the SPA uses the same format.
         ``interests`` filter to specific class categories (e.g. ``["Pickleball Open Play"]``);
-        omit to return every class.
+        omit to return every class. ``date_iso`` keeps only classes starting on
+        that day, skipping the rest of the window while parsing.
         """
         base_params: list[tuple[str, str]] = [
             ("start", _short_date(start)),
@@ -113,16 +151,9 @@ class LifetimeAPIClient:
         page = 1
         while True:
             params = [*base_params, ("page", str(page)), ("pageSize", "750")]
-            response = self._request(
-                "GET",
-                f"{API_BASE}/ux/web-schedules/v2/schedules/classes",
-                params=params,
-            )
-            payload = _response_json(
-                response,
-                f"GET {API_BASE}/ux/web-schedules/v2/schedules/classes",
-            )
-            events.extend(parse_class_events(payload))
+            response = self._request("GET", SCHEDULE_CLASSES_URL, params=params)
+            payload = _response_json(response, f"GET {SCHEDULE_CLASSES_URL}")
+            events.extend(parse_class_events(payload, date_iso=date_iso))
 
             if page >= _extract_total_pages(response):
                 return events
@@ -130,14 +161,9 @@ class LifetimeAPIClient:
 
     def get_registration_info(self, event_id: str) -> dict[str, Any]:
         """GET /events/{eventId}/registration — spot counts, required waivers, etc."""
-        response = self._request(
-            "GET",
-            f"{API_BASE}/ux/web-schedules/v2/events/{event_id}/registration",
-        )
-        payload = _response_json(
-            response,
-            f"GET {API_BASE}/ux/web-schedules/v2/events/{event_id}/registration",
-        )
+        url = EVENT_REGISTRATION_URL.format(event_id=event_id)
+        response = self._request("GET", url)
+        payload = _response_json(response, f"GET {url}")
         if not isinstance(payload, dict):
             raise LifetimeAPIError(
                 "Registration info response was not an object",
@@ -156,15 +182,8 @@ class LifetimeAPIClient:
             "eventId": event_id,
             "memberId": list(member_ids or [self.member_id]),
         }
-        response = self._request(
-            "POST",
-            f"{API_BASE}/sys/registrations/V3/ux/event",
-            json=body,
-        )
-        payload = _response_json(
-            response,
-            f"POST {API_BASE}/sys/registrations/V3/ux/event",
-        )
+        response = self._request("POST", REGISTRATIONS_URL, json=body)
+        payload = _response_json(response, f"POST {REGISTRATIONS_URL}")
         if not isinstance(payload, dict):
             raise LifetimeAPIError(
                 "POST /event response was not an object",
@@ -184,17 +203,11 @@ class LifetimeAPIClient:
             "memberId": list(member_ids or [self.member_id]),
             "acceptedDocuments": list(accepted_documents or []),
         }
-        response = self._request(
-            "PUT",
-            f"{API_BASE}/sys/registrations/V3/ux/event/{registration_id}/complete",
-            json=body,
-        )
+        url = f"{REGISTRATIONS_URL}/{registration_id}/complete"
+        response = self._request("PUT", url, json=body)
         if not response.text.strip():
             return {}
-        payload = _response_json(
-            response,
-            f"PUT {API_BASE}/sys/registrations/V3/ux/event/{registration_id}/complete",
-        )
+        payload = _response_json(response, f"PUT {url}")
         if not isinstance(payload, dict):
             raise LifetimeAPIError(
                 "PUT /complete response was not an object",
@@ -204,10 +217,7 @@ class LifetimeAPIClient:
 
     def cancel_registration(self, registration_id: int) -> None:
         """DELETE a registration. Useful for CI cleanup after smoke tests."""
-        self._request(
-            "DELETE",
-            f"{API_BASE}/sys/registrations/V3/ux/event/{registration_id}",
-        )
+        self._request("DELETE", f"{REGISTRATIONS_URL}/{registration_id}")
 
     def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
         headers = dict(kwargs.pop("headers", None) or {})
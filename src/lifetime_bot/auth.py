@@ -8,7 +8,7 @@ from typing import Any
 
 import requests
 
-from lifetime_bot.api import API_BASE, SUBSCRIPTION_KEY
+from lifetime_bot.api import API_BASE, SUBSCRIPTION_KEY, create_http_session
 from lifetime_bot.errors import LifetimeAPIError
 from lifetime_bot.models import SessionTokens
 
@@ -26,19 +26,24 @@ class AuthenticatedSession:
 
 
 class DirectAPIAuthenticator:
-    """Authenticate against Life Time's direct member APIs."""
+    """Authenticate against Life Time's direct member APIs.
+
+    Every login reuses the authenticator's HTTP session so a re-login after a
+    rejected token keeps the already-open connection pool.
+    """
 
     def __init__(
         self,
         *,
-        timeout: float = 10.0,
+        timeout: float | tuple[float, float] = 10.0,
         session_factory: SessionFactory | None = None,
     ) -> None:
         self.timeout = timeout
-        self.session_factory = session_factory or requests.Session
+        self.session_factory = session_factory or create_http_session
+        self._session: requests.Session | None = None
 
     def login(self, username: str, password: str) -> AuthenticatedSession:
-        session = self.session_factory()
+        session = self._login_session()
         login_response = session.post(
             DIRECT_LOGIN_URL,
             headers=self._direct_auth_headers(),
@@ -85,6 +90,16 @@ class DirectAPIAuthenticator:
             session=session,
         )
 
+    def _login_session(self) -> requests.Session:
+        session = self._session
+        if session is None:
+            session = self._session = self.session_factory()
+        else:
+            # Drop the previous member's cookies and token headers, keep the pool.
+            session.cookies.clear()
+            session.headers = requests.utils.default_headers()
+        return session
+
     def _direct_auth_headers(
         self, *, auth_token: str | None = None, ssoid: str | None = None
     ) -> dict[str, str]:
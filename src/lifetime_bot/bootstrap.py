@@ -13,6 +13,9 @@ from lifetime_bot.orchestrator import ReservationOrchestrator
 from lifetime_bot.reservations import ReservationService
 
 HTTP_TIMEOUT_SECONDS = 10.0
+# Fail fast on an unreachable host; the session's connect retries cover blips.
+HTTP_CONNECT_TIMEOUT_SECONDS = 3.05
+HTTP_TIMEOUTS = (HTTP_CONNECT_TIMEOUT_SECONDS, HTTP_TIMEOUT_SECONDS)
 DEFAULT_NOTIFICATION_TIMEOUT_SECONDS = 300.0
 
 
@@ -22,7 +25,7 @@ def create_bot(config: BotConfig | None = None) -> ReservationOrchestrator:
     config = config or BotConfig.from_env()
     return ReservationOrchestrator(
         config=config,
-        authenticator=DirectAPIAuthenticator(timeout=HTTP_TIMEOUT_SECONDS),
+        authenticator=DirectAPIAuthenticator(timeout=HTTP_TIMEOUTS),
         notifier=create_notifier(config.notifications),
         reservation_service_factory=create_reservation_service,
     )
@@ -34,7 +37,7 @@ def create_api_client(authenticated: AuthenticatedSession) -> LifetimeAPIClient:
     return LifetimeAPIClient(
         authenticated.tokens,
         session=authenticated.session,
-        timeout=HTTP_TIMEOUT_SECONDS,
+        timeout=HTTP_TIMEOUTS,
     )
 
 
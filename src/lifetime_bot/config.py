@@ -145,7 +145,7 @@ class BotConfig:
         """Create BotConfig from environment variables.
 
         Args:
-            reload_env: If True, clear and reload environment variables from .env file.
+            reload_env: If True, overlay values from the .env file onto the environment.
         """
         if reload_env:
             # Overlay .env onto the existing environment so shell-provided
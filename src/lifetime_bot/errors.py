@@ -1,5 +1,7 @@
 """Shared exception types for the Life Time bot."""
 
+SESSION_REJECTED_STATUS_CODES = frozenset({401, 403})
+
 
 class LifetimeAPIError(Exception):
     """Raised when a Life Time API call returns an unexpected response."""
@@ -12,6 +14,10 @@ class LifetimeAPIError(Exception):
     def is_retryable(self) -> bool:
         return self.status_code is not None and self.status_code >= 500
 
+    @property
+    def is_session_rejected(self) -> bool:
+        return self.status_code in SESSION_REJECTED_STATUS_CODES
+
 
 class ReservationAttemptError(Exception):
     """Raised when a reservation attempt fails during a known phase."""
@@ -27,3 +27,11 @@ class NotificationService(ABC):
         Returns:
             True if the service is configured and ready to send notifications.
         """
+
+    # Optional hook rather than an abstract method: most services hold nothing.
+    def close(self) -> None:  # noqa: B027
+        """Release any connection held between sends.
+
+        This is intentionally a no-op by default; services that keep a
+        connection open between sends override it.
+        """
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import atexit
 import os
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import threading
+from contextlib import ExitStack
+from email.message import EmailMessage
 
 from lifetime_bot.config import EmailConfig
 from lifetime_bot.notifications.base import NotificationService
@@ -14,7 +16,11 @@ DEFAULT_SMTP_TIMEOUT_SECONDS = 300.0
 
 
 class EmailNotificationService(NotificationService):
-    """Email notification service using SMTP."""
+    """Email notification service using SMTP.
+
+    The authenticated SMTP connection is opened on the first send and reused
+    for later sends until ``close()`` is called.
+    """
 
     def __init__(self, config: EmailConfig) -> None:
         """Initialize the email notification service.
@@ -23,6 +29,11 @@ class EmailNotificationService(NotificationService):
             config: Email configuration containing SMTP settings.
         """
         self.config = config
+        self._lock = threading.Lock()
+        self._connection: ExitStack | None = None
+        self._server: smtplib.SMTP | None = None
+        self._close_requested = False
+        self._close_registered = False
 
     def is_configured(self) -> bool:
         """Check if email configuration is valid."""
@@ -42,26 +53,89 @@ class EmailNotificationService(NotificationService):
             print("Email configuration is incomplete")
             return False
 
+        with self._lock:
+            try:
+                msg = EmailMessage()
+                msg["From"] = self.config.sender
+                msg["To"] = self.config.receiver
+                msg["Subject"] = subject
+                msg.set_content(message)
+
+                self._send_message(msg)
+            except Exception as e:
+                # Drop the broken connection before another send can reuse it.
+                self._close_connection()
+                print(f"Failed to send email: {e}")
+                return False
+            finally:
+                if self._close_requested:
+                    self._close_connection()
+        return True
+
+    def close(self) -> None:
+        """Close the pooled SMTP connection, if one is open.
+
+        Never waits behind an in-flight send: a send the notifier has already
+        timed out on may hold the connection until the SMTP socket timeout, so
+        that send closes the connection itself once it returns.
+        """
+        self._close_requested = True
+        if not self._lock.acquire(blocking=False):
+            print("SMTP connection is busy with a send; it will close when the send ends.")
+            return
         try:
-            msg = MIMEMultipart()
-            msg["From"] = self.config.sender
-            msg["To"] = self.config.receiver
-            msg["Subject"] = subject
-            msg.attach(MIMEText(message, "plain"))
-
-            with smtplib.SMTP(
-                self.config.smtp_server,
-                self.config.smtp_port,
-                timeout=_get_smtp_timeout_seconds(),
-            ) as server:
-                server.starttls()
-                server.login(self.config.sender, self.config.password)
-                server.send_message(msg)
-
-            return True
+            self._close_connection()
+        finally:
+            self._lock.release()
+
+    def _close_connection(self) -> None:
+        self._close_requested = False
+        connection, self._connection, self._server = self._connection, None, None
+        if connection is None:
+            return
+        try:
+            connection.close()
         except Exception as e:
-            print(f"Failed to send email: {e}")
-            return False
+            print(f"Failed to close SMTP connection cleanly: {e}")
+
+    def _send_message(self, msg: EmailMessage) -> None:
+        reused = self._server is not None
+        server = self._get_server()
+        try:
+            server.send_message(msg)
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            if not reused:
+                raise
+            # The server dropped the idle pooled connection; reconnect once.
+            self._close_connection()
+            self._get_server().send_message(msg)
+
+    def _get_server(self) -> smtplib.SMTP:
+        if self._server is not None:
+            return self._server
+        connection = ExitStack()
+        try:
+            server = connection.enter_context(
+                smtplib.SMTP(
+                    self.config.smtp_server,
+                    self.config.smtp_port,
+                    timeout=_get_smtp_timeout_seconds(),
+                )
+            )
+            server.starttls()
+            server.login(self.config.sender, self.config.password)
+        except BaseException:
+            connection.close()
+            raise
+        if not self._close_registered:
+            # Send QUIT on interpreter exit if no caller closed the service.
+            # close() skips a connection a timed-out send still holds, so
+            # this hook cannot keep the process alive until the SMTP timeout.
+            atexit.register(self.close)
+            self._close_registered = True
+        self._connection = connection
+        self._server = server
+        return server
 
 
 def _get_smtp_timeout_seconds() -> float:
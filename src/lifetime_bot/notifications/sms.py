@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from twilio.rest import Client
+from typing import TYPE_CHECKING
 
 from lifetime_bot.config import SMSConfig
 from lifetime_bot.notifications.base import NotificationService
 
+if TYPE_CHECKING:
+    from twilio.rest import Client
+
 
 class SMSNotificationService(NotificationService):
     """SMS notification service using Twilio."""
@@ -18,6 +21,7 @@ class SMSNotificationService(NotificationService):
             sms_config: SMS configuration containing Twilio credentials.
         """
         self.sms_config = sms_config
+        self._client: Client | None = None
 
     def is_configured(self) -> bool:
         """Check if SMS configuration is valid."""
@@ -41,8 +45,7 @@ class SMSNotificationService(NotificationService):
         try:
             sms_message = f"{subject}: {message}"
 
-            client = Client(self.sms_config.account_sid, self.sms_config.auth_token)
-            client.messages.create(
+            self._get_client().messages.create(
                 body=sms_message,
                 from_=self.sms_config.from_number,
                 to=self.sms_config.to_number,
@@ -52,3 +55,16 @@ class SMSNotificationService(NotificationService):
         except Exception as e:
             print(f"Failed to send SMS: {e}")
             return False
+
+    def _get_client(self) -> Client:
+        """Return the Twilio client, creating it on first use.
+
+        Twilio is imported here so email-only runs never pay for loading it.
+        """
+        if self._client is None:
+            from twilio.rest import Client
+
+            self._client = Client(
+                self.sms_config.account_sid, self.sms_config.auth_token
+            )
+        return self._client
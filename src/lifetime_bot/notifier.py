@@ -61,41 +61,42 @@ class NotificationCoordinator:
         method: NotificationMethod,
     ) -> NotificationDispatchResult:
         print(f"Notification phase started: {subject}")
-        attempts: list[NotificationAttempt] = []
+        channels: list[tuple[str, NotificationService]] = []
         if method in {"email", "both"}:
-            attempts.append(
-                self._send_via_channel(
-                    channel="email",
-                    service=self.email_service,
-                    subject=subject,
-                    message=message,
-                )
-            )
+            channels.append(("email", self.email_service))
         if method in {"sms", "both"}:
-            attempts.append(
-                self._send_via_channel(
-                    channel="sms",
-                    service=self.sms_service,
-                    subject=subject,
-                    message=message,
-                )
-            )
-        return NotificationDispatchResult(subject=subject, attempts=tuple(attempts))
+            channels.append(("sms", self.sms_service))
+        if not channels:
+            return NotificationDispatchResult(subject=subject, attempts=())
+        # Start every channel's bounded thread before waiting on any of them,
+        # so the fan-out costs the slowest channel rather than the sum.
+        calls = [
+            (channel, _BoundedCall(lambda service=service: service.send(subject, message)))
+            for channel, service in channels
+        ]
+        attempts = tuple(
+            self._finish_channel(channel=channel, call=call, subject=subject)
+            for channel, call in calls
+        )
+        return NotificationDispatchResult(subject=subject, attempts=attempts)
+
+    def close(self) -> None:
+        """Release connections held by the channel services."""
+        for service in (self.email_service, self.sms_service):
+            try:
+                service.close()
+            except Exception as exc:
+                print(f"Could not close {type(service).__name__}: {exc}")
 
-    def _send_via_channel(
+    def _finish_channel(
         self,
         *,
         channel: str,
-        service: NotificationService,
+        call: _BoundedCall,
         subject: str,
-        message: str,
     ) -> NotificationAttempt:
-        started = time.perf_counter()
-        result = _run_with_timeout(
-            lambda: service.send(subject, message),
-            timeout_seconds=self.timeout_seconds,
-        )
-        elapsed = time.perf_counter() - started
+        result = call.wait(self.timeout_seconds)
+        elapsed = call.elapsed_seconds
         label = channel.upper() if channel == "sms" else channel.title()
         if not result.completed:
             print(
@@ -121,27 +122,39 @@ class NotificationCoordinator:
         )
 
 
-def _run_with_timeout(
-    callback: Callable[[], bool], *, timeout_seconds: float
-) -> TimedAttemptResult:
-    result: dict[str, Any] = {"done": False, "value": False, "error": None}
+class _BoundedCall:
+    """Run a callback on a daemon thread that a caller waits on with a timeout."""
+
+    def __init__(self, callback: Callable[[], bool]) -> None:
+        self._result: dict[str, Any] = {"done": False, "value": False, "error": None}
+        self._started = time.perf_counter()
+        self._finished: float | None = None
+        self._thread = threading.Thread(target=self._target, args=(callback,), daemon=True)
+        self._thread.start()
+
+    @property
+    def elapsed_seconds(self) -> float:
+        finished = self._finished if self._finished is not None else time.perf_counter()
+        return finished - self._started
+
+    def wait(self, timeout_seconds: float) -> TimedAttemptResult:
+        """Wait until ``timeout_seconds`` after the call started."""
+        remaining = timeout_seconds - (time.perf_counter() - self._started)
+        self._thread.join(max(0.0, remaining))
+        if not self._result["done"]:
+            return TimedAttemptResult(completed=False, succeeded=False)
+        return TimedAttemptResult(
+            completed=True,
+            succeeded=bool(self._result["value"]),
+            error=self._result["error"],
+        )
 
-    def _target() -> None:
+    def _target(self, callback: Callable[[], bool]) -> None:
         try:
-            result["value"] = bool(callback())
+            self._result["value"] = bool(callback())
         except Exception as exc:  # pragma: no cover - exercised through caller logs
-            result["error"] = f"{type(exc).__name__}: {exc}"
-            result["value"] = False
+            self._result["error"] = f"{type(exc).__name__}: {exc}"
+            self._result["value"] = False
         finally:
-            result["done"] = True
-
-    thread = threading.Thread(target=_target, daemon=True)
-    thread.start()
-    thread.join(timeout_seconds)
-    if not result["done"]:
-        return TimedAttemptResult(completed=False, succeeded=False)
-    return TimedAttemptResult(
-        completed=True,
-        succeeded=bool(result["value"]),
-        error=result["error"],
-    )
+            self._finished = time.perf_counter()
+            self._result["done"] = True
@@ -32,10 +32,17 @@ def main(argv: list[str] | None = None) -> int:
     body = str(payload["body"])
     if summary_only:
         return 0
+    if payload.get("outcome") == "skipped":
+        # Off days record a result for the step summary but notify nobody.
+        print("Skipping notification for a run that attempted no reservation.")
+        return 0
 
     config = NotificationConfig.from_env()
     notifier = create_notifier(config)
-    dispatch = notifier.send(subject, body, method=config.method)
+    try:
+        dispatch = notifier.send(subject, body, method=config.method)
+    finally:
+        notifier.close()
     _log_notification_delivery(dispatch)
     return 0 if _dispatch_succeeded(dispatch) else 1
 
@@ -33,6 +33,8 @@ class Notifier(Protocol):
         method: NotificationMethod,
     ) -> NotificationDispatchResult: ...
 
+    def close(self) -> None: ...
+
 
 class ReservationServiceLike(Protocol):
     """Boundary for class lookup and reservation lifecycle operations."""
@@ -66,46 +68,33 @@ class ReservationOrchestrator:
         self.authenticator = authenticator
         self.notifier = notifier
         self.reservation_service_factory = reservation_service_factory
+        self._authenticated: AuthenticatedSession | None = None
+        self._target_date: str | None = None
+        self._prepared_event: ClassEvent | None = None
+        self._class_details_cache: str | None = None
 
     def reserve_class(self) -> RegistrationResult:
         """Run the full auth → find class → reserve flow. Raises on failure."""
         started = time.perf_counter()
         target_date = self._get_target_date()
-        class_details = format_class_details(self.config, target_date)
+        class_details = self._class_details()
 
         try:
-            auth_started = time.perf_counter()
-            authenticated = self.authenticator.login(
-                self.config.username,
-                self.config.password,
-            )
-            print(f"Auth completed in {time.perf_counter() - auth_started:.2f}s.")
+            authenticated = self._authenticate()
         except Exception as exc:
             self._log_failure(exc, phase="login")
             raise ReservationAttemptError("login", exc) from exc
 
         reservation_service = self.reservation_service_factory(authenticated)
         try:
-            lookup_started = time.perf_counter()
-            event = reservation_service.find_target_event(
-                club_name=self.config.club.name,
-                target_class=self.config.target_class,
-                target_date=target_date,
-            )
+            event, self._prepared_event = self._prepared_event, None
             if event is None:
-                raise LifetimeAPIError(
-                    f"Target class not found in schedule for {target_date}. "
-                    f"Looked for name~='{self.config.target_class.name}' "
-                    f"instructor~='{self.config.target_class.instructor or '(ignored)'}' "
-                    f"at {self.config.target_class.start_time}-{self.config.target_class.end_time}."
+                event = self._find_event(reservation_service, target_date)
+            else:
+                print(
+                    "Using class resolved before the target time "
+                    f"(event id {event.event_id})."
                 )
-            print(
-                f"Schedule lookup completed in {time.perf_counter() - lookup_started:.2f}s."
-            )
-            print(
-                f"Matched class '{event.name}' with {event.instructor} at "
-                f"{event.start} (event id {event.event_id})."
-            )
 
             registration_started = time.perf_counter()
             result = reservation_service.reserve_event(event.event_id)
@@ -114,6 +103,7 @@ class ReservationOrchestrator:
                 f"{time.perf_counter() - registration_started:.2f}s."
             )
         except Exception as exc:
+            self._forget_rejected_session(exc)
             self._log_failure(exc, phase="reservation")
             raise ReservationAttemptError("reservation", exc) from exc
 
@@ -124,6 +114,29 @@ class ReservationOrchestrator:
         )
         return result
 
+    def prepare_session(self) -> None:
+        """Log in and resolve the target class ahead of the reservation window.
+
+        The first attempt then goes straight to registering. Failures are only
+        logged; the first attempt logs in or searches the schedule as usual.
+        """
+        try:
+            authenticated = self._authenticate()
+        except Exception as exc:
+            print(f"Pre-login failed; the first attempt will log in again: {exc}")
+            return
+        try:
+            self._prepared_event = self._find_event(
+                self.reservation_service_factory(authenticated),
+                self._get_target_date(),
+            )
+        except Exception as exc:
+            self._forget_rejected_session(exc)
+            print(
+                "Pre-lookup failed; the first attempt will search the schedule "
+                f"again: {exc}"
+            )
+
     def build_outcome_notification(
         self, result: RegistrationResult
     ) -> tuple[str, str]:
@@ -148,14 +161,75 @@ class ReservationOrchestrator:
             method=self.config.notification_method,
         )
 
-    def _get_target_date(self) -> str:
-        return get_target_date(
-            self.config.run_on_schedule,
-            self.config.target_class.date,
+    def close(self) -> None:
+        """Release the member HTTP session and notification connections."""
+        authenticated, self._authenticated = self._authenticated, None
+        if authenticated is not None:
+            try:
+                authenticated.session.close()
+            except Exception as exc:
+                print(f"Could not close member HTTP session: {exc}")
+        self.notifier.close()
+
+    def _find_event(
+        self, reservation_service: ReservationServiceLike, target_date: str
+    ) -> ClassEvent:
+        lookup_started = time.perf_counter()
+        event = reservation_service.find_target_event(
+            club_name=self.config.club.name,
+            target_class=self.config.target_class,
+            target_date=target_date,
         )
+        if event is None:
+            raise LifetimeAPIError(
+                f"Target class not found in schedule for {target_date}. "
+                f"Looked for name~='{self.config.target_class.name}' "
+                f"instructor~='{self.config.target_class.instructor or '(ignored)'}' "
+                f"at {self.config.target_class.start_time}-{self.config.target_class.end_time}."
+            )
+        print(f"Schedule lookup completed in {time.perf_counter() - lookup_started:.2f}s.")
+        print(
+            f"Matched class '{event.name}' with {event.instructor} at "
+            f"{event.start} (event id {event.event_id})."
+        )
+        return event
+
+    def _forget_rejected_session(self, exc: BaseException) -> None:
+        if isinstance(exc, LifetimeAPIError) and exc.is_session_rejected:
+            print("API rejected the member session; the next attempt will log in again.")
+            self._authenticated = None
+
+    def _authenticate(self) -> AuthenticatedSession:
+        """Log in once and reuse the member session until the API rejects it."""
+        if self._authenticated is not None:
+            print("Reusing authenticated member session.")
+            return self._authenticated
+        auth_started = time.perf_counter()
+        self._authenticated = self.authenticator.login(
+            self.config.username,
+            self.config.password,
+        )
+        print(f"Auth completed in {time.perf_counter() - auth_started:.2f}s.")
+        return self._authenticated
+
+    def _get_target_date(self) -> str:
+        """Resolve the target date on first use and keep it for every retry.
+
+        A retry that crosses midnight still books the date the run started for.
+        """
+        if self._target_date is None:
+            self._target_date = get_target_date(
+                self.config.run_on_schedule,
+                self.config.target_class.date,
+            )
+        return self._target_date
 
     def _class_details(self) -> str:
-        return format_class_details(self.config, self._get_target_date())
+        if self._class_details_cache is None:
+            self._class_details_cache = format_class_details(
+                self.config, self._get_target_date()
+            )
+        return self._class_details_cache
 
     def _log_failure(self, exc: BaseException, *, phase: str) -> None:
         error_type = type(exc).__name__
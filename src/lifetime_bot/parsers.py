@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any
 
 from lifetime_bot.errors import LifetimeAPIError
@@ -17,31 +17,67 @@ def match_class(
     start_time_local: str | None = None,
     end_time_local: str | None = None,
     date_iso: str | None = None,
+    allow_unlisted_instructor: bool = False,
 ) -> ClassEvent | None:
-    """Find the first ClassEvent matching all provided criteria."""
+    """Find the first ClassEvent matching all provided criteria.
+
+    With ``allow_unlisted_instructor``, when no event matches the instructor
+    filter, the first otherwise-matching event is returned if it lists no
+    instructor. Both checks share one pass over ``classes``.
+    """
 
     name_key = name_contains.strip().lower()
     instructor_key = instructor_contains.strip().lower()
+    start_key = _parse_time_key(start_time_local) if start_time_local else None
+    end_key = _parse_time_key(end_time_local) if end_time_local else None
+    target_day = _parse_date_iso(date_iso) if date_iso else None
+    if date_iso and target_day is None:
+        return None
+    if (start_time_local and start_key is None) or (end_time_local and end_key is None):
+        return None
+    fallback: ClassEvent | None = None
     for event in classes:
         if name_key and name_key not in event.name.lower():
             continue
-        if instructor_key and instructor_key not in event.instructor.lower():
+        if target_day and (event.start is None or event.start.date() != target_day):
             continue
-        if date_iso and (event.start is None or event.start.date().isoformat() != date_iso):
+        if start_key and (
+            event.start is None or (event.start.hour, event.start.minute) != start_key
+        ):
             continue
-        if start_time_local and _format_time(event.start) != start_time_local.strip():
+        if end_key and (event.end is None or (event.end.hour, event.end.minute) != end_key):
             continue
-        if end_time_local and _format_time(event.end) != end_time_local.strip():
+        if instructor_key and instructor_key not in event.instructor.lower():
+            if fallback is None:
+                fallback = event
             continue
         return event
+    if allow_unlisted_instructor and fallback is not None and not fallback.instructor.strip():
+        return fallback
     return None
 
 
-def parse_class_events(payload: Any) -> list[ClassEvent]:
-    schedule_activities = _extract_schedule_activities(payload)
-    if schedule_activities:
-        return [_parse_class_event(item) for item in schedule_activities]
-    return [_parse_class_event(item) for item in _extract_list(payload)]
+def parse_class_events(payload: Any, *, date_iso: str | None = None) -> list[ClassEvent]:
+    """Parse schedule payloads, optionally keeping only events starting on ``date_iso``.
+
+    Nested schedule payloads are grouped by day, so other days are skipped
+    before any of their activities are flattened or parsed.
+    """
+
+    if _is_schedule_payload(payload):
+        return [
+            _parse_class_event(item)
+            for item in _extract_schedule_activities(payload, date_iso=date_iso)
+        ]
+    events = [_parse_class_event(item) for item in _extract_list(payload)]
+    if date_iso is None:
+        return events
+    target_day = _parse_date_iso(date_iso)
+    return [
+        event
+        for event in events
+        if event.start is not None and event.start.date() == target_day
+    ]
 
 
 def parse_registration_result(payload: dict[str, Any]) -> RegistrationResult:
@@ -95,6 +131,27 @@ def extract_required_document_ids(payload: dict[str, Any]) -> list[int] | None:
     return None
 
 
+def _parse_date_iso(value: str) -> date | None:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _parse_time_key(value: str) -> tuple[int, int] | None:
+    """Parse an ``H:MM AM`` filter once into the (hour, minute) events compare against."""
+
+    text = value.strip()
+    try:
+        parsed = datetime.strptime(text, "%I:%M %p")
+    except ValueError:
+        return None
+    # Only the exact display format matches, as with the old string comparison.
+    if _format_time(parsed) != text:
+        return None
+    return parsed.hour, parsed.minute
+
+
 def _format_time(dt: datetime | None) -> str:
     if dt is None:
         return ""
@@ -181,19 +238,26 @@ def _extract_spots(item: dict[str, Any]) -> int | None:
     return None
 
 
-def _extract_schedule_activities(payload: Any) -> list[dict[str, Any]]:
+def _is_schedule_payload(payload: Any) -> bool:
     if not isinstance(payload, dict):
-        return []
+        return False
     results = payload.get("results")
     if not isinstance(results, list):
-        return []
+        return False
+    return any(isinstance(day, dict) and "dayParts" in day for day in results)
 
+
+def _extract_schedule_activities(
+    payload: dict[str, Any], *, date_iso: str | None = None
+) -> list[dict[str, Any]]:
     activities: list[dict[str, Any]] = []
-    for day in results:
+    for day in payload["results"]:
         if not isinstance(day, dict):
             continue
-        date_iso = day.get("day")
-        if not isinstance(date_iso, str):
+        day_iso = day.get("day")
+        if not isinstance(day_iso, str):
+            continue
+        if date_iso is not None and day_iso != date_iso:
             continue
         for day_part in day.get("dayParts") or []:
             if not isinstance(day_part, dict):
@@ -201,14 +265,14 @@ def _extract_schedule_activities(payload: Any) -> list[dict[str, Any]]:
             for start_time in day_part.get("startTimes") or []:
                 if not isinstance(start_time, dict):
                     continue
-                start = _combine_schedule_datetime(date_iso, start_time.get("time"))
+                start = _combine_schedule_datetime(day_iso, start_time.get("time"))
                 for activity in start_time.get("activities") or []:
                     if not isinstance(activity, dict):
                         continue
                     flattened = dict(activity)
                     if start is not None:
                         flattened.setdefault("start", start.isoformat())
-                    end = _combine_schedule_datetime(date_iso, activity.get("endTime"))
+                    end = _combine_schedule_datetime(day_iso, activity.get("endTime"))
                     if start is not None and end is not None and end <= start:
                         end += timedelta(days=1)
                     if end is not None:
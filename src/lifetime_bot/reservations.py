@@ -14,10 +14,38 @@ from lifetime_bot.errors import LifetimeAPIError
 from lifetime_bot.models import ClassEvent, RegistrationOutcome, RegistrationResult
 from lifetime_bot.parsers import extract_required_document_ids, match_class
 
-POST_COMPLETE_CONFIRMATION_ATTEMPTS = 6
-POST_COMPLETE_CONFIRMATION_DELAY_SECONDS = 2.0
-POST_ERROR_CONFIRMATION_ATTEMPTS = 6
-POST_ERROR_CONFIRMATION_DELAY_SECONDS = 2.0
+POST_COMPLETE_CONFIRMATION_DELAY_SECONDS = 0.5
+POST_ERROR_CONFIRMATION_DELAY_SECONDS = 0.5
+CONFIRMATION_MAX_DELAY_SECONDS = 2.0
+# Total sleep the confirmation polls may spend before giving up (the old
+# schedule was six checks two seconds apart).
+CONFIRMATION_WINDOW_SECONDS = 10.0
+
+
+def confirmation_attempts_for_window(
+    initial_delay_seconds: float,
+    *,
+    max_delay_seconds: float = CONFIRMATION_MAX_DELAY_SECONDS,
+    window_seconds: float = CONFIRMATION_WINDOW_SECONDS,
+) -> int:
+    """Return how many checks the doubling backoff needs to cover ``window_seconds``."""
+
+    attempts = 1
+    slept = 0.0
+    delay = max(initial_delay_seconds, 0.0)
+    while slept < window_seconds and delay > 0:
+        slept += delay
+        attempts += 1
+        delay = min(delay * 2, max(delay, max_delay_seconds))
+    return attempts
+
+
+POST_COMPLETE_CONFIRMATION_ATTEMPTS = confirmation_attempts_for_window(
+    POST_COMPLETE_CONFIRMATION_DELAY_SECONDS
+)
+POST_ERROR_CONFIRMATION_ATTEMPTS = confirmation_attempts_for_window(
+    POST_ERROR_CONFIRMATION_DELAY_SECONDS
+)
 
 
 class ReservationService:
@@ -66,6 +94,7 @@ class ReservationService:
             location=club_name,
             start=week_start,
             end=week_end,
+            date_iso=target_date,
         )
         print(f"Schedule API returned {len(classes)} classes for {target_date}.")
         match = match_class(
@@ -75,28 +104,24 @@ class ReservationService:
             start_time_local=target_class.start_time,
             end_time_local=target_class.end_time,
             date_iso=target_date,
+            allow_unlisted_instructor=True,
         )
-        if match is not None or not target_class.instructor:
-            return match
-
-        fallback = match_class(
-            classes,
-            name_contains=target_class.name,
-            instructor_contains="",
-            start_time_local=target_class.start_time,
-            end_time_local=target_class.end_time,
-            date_iso=target_date,
-        )
-        if fallback is not None and not fallback.instructor.strip():
+        if match is not None and target_class.instructor and not match.instructor.strip():
             print(
                 "Matched a class with no listed instructor; "
                 f"ignoring configured instructor filter {target_class.instructor!r}."
             )
-            return fallback
-        return None
+        return match
 
     def reserve_event(self, event_id: str) -> RegistrationResult:
-        result = self.detect_existing_registration(event_id, context="preflight")
+        preflight_info = self._load_registration_info(event_id, context="preflight")
+        result = (
+            None
+            if preflight_info is None
+            else self._registration_from_info(
+                event_id, preflight_info, context="preflight"
+            )
+        )
         if result is None:
             try:
                 result = self.client.register(event_id)
@@ -133,6 +158,13 @@ class ReservationService:
         if result.needs_complete:
             pending_result = result
             documents = result.required_documents
+            if documents is None and preflight_info is not None:
+                documents = extract_required_document_ids(preflight_info)
+                if documents is not None:
+                    print(
+                        "Reusing waiver/document ids from preflight registration "
+                        f"info: {documents}."
+                    )
             if documents is None:
                 documents = self.fetch_required_documents(event_id)
             accepted_documents = list(documents or [])
@@ -200,14 +232,25 @@ class ReservationService:
     def detect_existing_registration(
         self, event_id: str, *, context: str
     ) -> RegistrationResult | None:
+        info = self._load_registration_info(event_id, context=context)
+        if info is None:
+            return None
+        return self._registration_from_info(event_id, info, context=context)
+
+    def _load_registration_info(
+        self, event_id: str, *, context: str
+    ) -> dict[str, Any] | None:
         try:
-            info = self.client.get_registration_info(event_id)
+            return self.client.get_registration_info(event_id)
         except LifetimeAPIError as exc:
             print(f"Could not fetch registration info during {context}: {exc}")
             if exc.status_code == 404:
                 return None
             raise
 
+    def _registration_from_info(
+        self, event_id: str, info: dict[str, Any], *, context: str
+    ) -> RegistrationResult | None:
         registered = info.get("registeredMembers")
         unregistered = info.get("unregisteredMembers")
         register_cta = "yes" if info.get("registerCta") else "no"
@@ -272,6 +315,8 @@ class ReservationService:
         delay_seconds: float,
         waiting_reason: str,
     ) -> RegistrationResult | None:
+        # Registration state usually settles within a second, so poll quickly
+        # first and back off toward the cap instead of always waiting the max.
         for attempt in range(1, attempts + 1):
             verified = self.detect_existing_registration(
                 event_id,
@@ -286,6 +331,9 @@ class ReservationService:
                 f"verification retry {attempt + 1}/{attempts}."
             )
             self.sleep(delay_seconds)
+            delay_seconds = min(
+                delay_seconds * 2, max(delay_seconds, CONFIRMATION_MAX_DELAY_SECONDS)
+            )
         return None
 
 
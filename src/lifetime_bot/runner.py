@@ -12,6 +12,7 @@ from typing import Protocol
 import requests
 
 from lifetime_bot.bootstrap import create_bot
+from lifetime_bot.config import BotConfig
 from lifetime_bot.errors import LifetimeAPIError, ReservationAttemptError
 from lifetime_bot.models import RegistrationResult
 
@@ -19,6 +20,8 @@ from lifetime_bot.models import RegistrationResult
 class ReservationBot(Protocol):
     """Boundary for executing a reservation attempt."""
 
+    def prepare_session(self) -> None: ...
+
     def reserve_class(self) -> RegistrationResult: ...
 
     def build_outcome_notification(
@@ -29,6 +32,8 @@ class ReservationBot(Protocol):
 
     def send_notification(self, subject: str, message: str) -> object: ...
 
+    def close(self) -> None: ...
+
 
 BotFactory = Callable[[], ReservationBot]
 RESULT_PATH_ENV = "LIFETIME_BOT_RESULT_PATH"
@@ -41,89 +46,156 @@ class RetryableReservationError(RuntimeError):
 
 def run_bot(
     *,
-    bot_factory: BotFactory = create_bot,
+    bot_factory: BotFactory | None = None,
     max_retries: int | None = None,
     retry_delay: float | None = None,
+    max_retry_delay: float | None = None,
     sleep: Callable[[float], None] = time.sleep,
 ) -> bool:
-    """Run the reservation flow with retry handling."""
+    """Run the reservation flow with retry handling.
+
+    The first retry waits ``retry_delay`` seconds and each later wait doubles,
+    capped at ``max_retry_delay``, so early retries stay quick while a
+    struggling API is not hammered.
+    """
 
+    bot_factory = bot_factory or default_bot_factory()
     max_retries = max_retries or max(1, int(os.getenv("MAX_RETRIES", "3")))
     retry_delay = (
         retry_delay
         if retry_delay is not None
         else float(os.getenv("RETRY_DELAY_SECONDS", "5"))
     )
+    max_retry_delay = (
+        max_retry_delay
+        if max_retry_delay is not None
+        else float(os.getenv("MAX_RETRY_DELAY_SECONDS", "30"))
+    )
+    max_retry_delay = max(retry_delay, max_retry_delay)
     retry_count = 0
     started = time.perf_counter()
 
-    while retry_count < max_retries:
-        bot = None
-        attempt_started = time.perf_counter()
-        try:
-            print(f"Attempt {retry_count + 1}/{max_retries} to reserve class")
-            bot = bot_factory()
-            result = bot.reserve_class()
-            if result.is_terminal:
-                subject, body = bot.build_outcome_notification(result)
-                _record_final_result(
-                    success=True,
-                    subject=subject,
-                    body=body,
-                    outcome=result.outcome.value,
+    used_bots: list[ReservationBot] = []
+    try:
+        while retry_count < max_retries:
+            bot = None
+            attempt_started = time.perf_counter()
+            try:
+                print(f"Attempt {retry_count + 1}/{max_retries} to reserve class")
+                bot = bot_factory()
+                if not any(used is bot for used in used_bots):
+                    used_bots.append(bot)
+                result = bot.reserve_class()
+                if result.is_terminal:
+                    subject, body = bot.build_outcome_notification(result)
+                    _record_final_result(
+                        success=True,
+                        subject=subject,
+                        body=body,
+                        outcome=result.outcome.value,
+                    )
+                    _send_notification(bot, subject, body, context="outcome")
+                    print(
+                        f"Attempt {retry_count + 1}/{max_retries} succeeded in "
+                        f"{time.perf_counter() - attempt_started:.2f}s"
+                    )
+                    print(f"Run completed in {time.perf_counter() - started:.2f}s")
+                    print(
+                        "Class reservation completed with outcome: "
+                        f"{result.outcome.value}."
+                    )
+                    return True
+                raise RetryableReservationError(
+                    "Reservation attempt returned a non-terminal outcome without raising "
+                    "an error"
                 )
-                _send_notification(bot, subject, body, context="outcome")
+            except Exception as exc:
+                retry_count += 1
                 print(
-                    f"Attempt {retry_count + 1}/{max_retries} succeeded in "
-                    f"{time.perf_counter() - attempt_started:.2f}s"
+                    f"Attempt {retry_count}/{max_retries} failed after "
+                    f"{time.perf_counter() - attempt_started:.2f}s with error: {exc!s}"
                 )
-                print(f"Run completed in {time.perf_counter() - started:.2f}s")
+
+                should_retry = retry_count < max_retries and _should_retry(exc)
+                if not should_retry:
+                    subject, body = _build_terminal_failure_notification(
+                        bot,
+                        exc,
+                        max_retries=max_retries,
+                    )
+                    _record_final_result(
+                        success=False,
+                        subject=subject,
+                        body=body,
+                        error_phase=_failure_phase(exc),
+                        error_type=type(_root_cause(exc)).__name__,
+                        error_message=str(_root_cause(exc)),
+                    )
+                    if bot is not None:
+                        _send_notification(bot, subject, body, context="failure")
+                    break
                 print(
-                    "Class reservation completed with outcome: "
-                    f"{result.outcome.value}."
-                )
-                return True
-            raise RetryableReservationError(
-                "Reservation attempt returned a non-terminal outcome without raising "
-                "an error"
-            )
-        except Exception as exc:
-            retry_count += 1
-            print(
-                f"Attempt {retry_count}/{max_retries} failed after "
-                f"{time.perf_counter() - attempt_started:.2f}s with error: {exc!s}"
-            )
-
-            should_retry = retry_count < max_retries and _should_retry(exc)
-            if not should_retry:
-                subject, body = _build_terminal_failure_notification(
-                    bot,
-                    exc,
-                    max_retries=max_retries,
+                    f"Waiting {retry_delay:g} seconds before retry "
+                    f"{retry_count + 1}/{max_retries}..."
                 )
-                _record_final_result(
-                    success=False,
-                    subject=subject,
-                    body=body,
-                    error_phase=_failure_phase(exc),
-                    error_type=type(_root_cause(exc)).__name__,
-                    error_message=str(_root_cause(exc)),
-                )
-                if bot is not None:
-                    _send_notification(bot, subject, body, context="failure")
-                break
-            print(
-                f"Waiting {retry_delay:g} seconds before retry "
-                f"{retry_count + 1}/{max_retries}..."
-            )
-            sleep(retry_delay)
+                sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, max_retry_delay)
+    finally:
+        _close_bots(used_bots)
 
     print(f"Run failed after {time.perf_counter() - started:.2f}s")
     return False
 
 
+def default_bot_factory() -> BotFactory:
+    """Build one production bot per run and hand it to every attempt.
+
+    The environment and ``.env`` are read once, and retries keep the same
+    orchestrator so its authenticated session and HTTP pool survive a
+    transient failure. If construction fails, the next attempt tries again.
+    """
+
+    bot: ReservationBot | None = None
+
+    def _factory() -> ReservationBot:
+        nonlocal bot
+        if bot is None:
+            bot = create_bot(BotConfig.from_env())
+        return bot
+
+    return _factory
+
+
+def record_skipped_run(reason: str) -> None:
+    """Record a run that intentionally did no reservation work."""
+
+    print(f"Skipping reservation run: {reason}")
+    _record_final_result(
+        success=True,
+        subject="Lifetime Bot - Skipped",
+        body=f"No reservation was attempted.\n\nReason: {reason}",
+        outcome="skipped",
+    )
+
+
+def _close_bots(bots: list[ReservationBot]) -> None:
+    for bot in bots:
+        try:
+            bot.close()
+        except Exception as exc:
+            print(f"Could not close reservation bot: {exc}")
+
+
 def _should_retry(exc: BaseException) -> bool:
     if isinstance(exc, ReservationAttemptError):
+        # A member session rejected after login is dropped by the bot, so the
+        # next attempt logs in again. Rejected credentials at login stay final.
+        if (
+            exc.phase == "reservation"
+            and isinstance(exc.cause, LifetimeAPIError)
+            and exc.cause.is_session_rejected
+        ):
+            return True
         return _should_retry(exc.cause)
     if isinstance(exc, RetryableReservationError):
         return True
@@ -4,9 +4,17 @@ from __future__ import annotations
 
 import datetime
 import time
-from typing import Callable
+from typing import Callable, TypeVar
 from zoneinfo import ZoneInfo
 
+T = TypeVar("T")
+
+UTC = datetime.timezone.utc
+WAIT_CHUNK_SECONDS = 30.0
+FINAL_APPROACH_SECONDS = 0.5
+SPIN_SLEEP_SECONDS = 0.001
+VALID_BOOKING_WEEKDAYS = frozenset({0, 1, 2, 3, 6})
+
 
 def get_target_utc_time(local_time: str, timezone: str) -> str:
     """Convert a local time to UTC, automatically handling DST.
@@ -24,10 +32,27 @@ def get_target_utc_time(local_time: str, timezone: str) -> str:
         now.date(),
         datetime.datetime.strptime(local_time, "%H:%M:%S").time(),
     ).replace(tzinfo=tz)
-    utc_dt = local_dt.astimezone(datetime.timezone.utc)
+    utc_dt = local_dt.astimezone(UTC)
     return utc_dt.strftime("%H:%M:%S")
 
 
+def get_lead_utc_time(target_utc_time: str, lead_seconds: float) -> str:
+    """Return the UTC time ``lead_seconds`` before a target UTC time.
+
+    Args:
+        target_utc_time: Target UTC time in HH:MM:SS format.
+        lead_seconds: How far ahead of the target to return.
+
+    Returns:
+        UTC time in HH:MM:SS format, clamped to midnight rather than wrapping
+        to the previous day, which ``wait_until_utc`` would read as ~24h away.
+    """
+    target = datetime.datetime.strptime(target_utc_time, "%H:%M:%S")
+    midnight = target.replace(hour=0, minute=0, second=0)
+    lead = max(target - datetime.timedelta(seconds=lead_seconds), midnight)
+    return lead.strftime("%H:%M:%S")
+
+
 def get_target_date(run_on_schedule: bool, target_date: str | None = None) -> str:
     """Calculate target date for class reservation.
 
@@ -51,35 +76,49 @@ def is_valid_day() -> bool:
     Returns:
         True if today is a valid scheduling day.
     """
-    return datetime.datetime.today().weekday() in [0, 1, 2, 3, 6]
+    return datetime.datetime.today().weekday() in VALID_BOOKING_WEEKDAYS
 
 
-def wait_until_utc(target_utc_time: str, callback: Callable[[], None]) -> None:
+def wait_until_utc(target_utc_time: str, callback: Callable[[], T]) -> T:
     """Wait until the given target UTC time, then execute the callback.
 
     If the current time is already past the target, executes immediately.
+    Long waits sleep in bounded chunks and re-read the clock each time, so
+    clock adjustments during the wait cannot cause a late wake-up. The final
+    minute runs against a monotonic deadline, polling the last half second.
 
     Args:
         target_utc_time: The UTC time to wait until (e.g., "16:00:00").
         callback: Function to call when the target time is reached.
+
+    Returns:
+        Whatever the callback returns.
     """
-    now = datetime.datetime.now(datetime.timezone.utc)
+    now = datetime.datetime.now(UTC)
     target = datetime.datetime.strptime(target_utc_time, "%H:%M:%S").time()
-    target_datetime = datetime.datetime.combine(now.date(), target).replace(
-        tzinfo=datetime.timezone.utc
-    )
+    target_datetime = datetime.datetime.combine(now.date(), target).replace(tzinfo=UTC)
 
     if now >= target_datetime:
         print(
             f"Current time ({now.strftime('%H:%M:%S')} UTC) is past {target_utc_time}, "
             "running immediately."
         )
-        callback()
-        return
+        return callback()
 
     sleep_seconds = (target_datetime - now).total_seconds()
     print(f"Sleeping for {sleep_seconds:.2f} seconds...")
-    time.sleep(sleep_seconds)
+    while True:
+        remaining = (target_datetime - datetime.datetime.now(UTC)).total_seconds()
+        if remaining <= 2 * WAIT_CHUNK_SECONDS:
+            break
+        time.sleep(WAIT_CHUNK_SECONDS)
+
+    # Finish against one monotonic deadline instead of re-reading the wall clock.
+    deadline = time.monotonic() + max(0.0, remaining)
+    if remaining > FINAL_APPROACH_SECONDS:
+        time.sleep(remaining - FINAL_APPROACH_SECONDS)
+    while time.monotonic() < deadline:
+        time.sleep(SPIN_SLEEP_SECONDS)
 
     print(f"Reached target UTC time: {target_datetime.strftime('%H:%M:%S')} UTC")
-    callback()
+    return callback()
@@ -54,7 +54,7 @@ class TestBotNotificationIntegration:
         sent_message = mock_server.send_message.call_args[0][0]
         assert sent_message["Subject"] == "Test Subject"
 
-    @patch("lifetime_bot.notifications.sms.Client")
+    @patch("twilio.rest.Client")
     def test_bot_sends_sms_notification(
         self, mock_client_class: MagicMock, bot_config: BotConfig
     ) -> None:
@@ -73,7 +73,7 @@ class TestBotNotificationIntegration:
         assert kwargs["to"] == bot_config.sms.to_number
 
     @patch("lifetime_bot.notifications.email.smtplib.SMTP")
-    @patch("lifetime_bot.notifications.sms.Client")
+    @patch("twilio.rest.Client")
     def test_bot_sends_both_notifications(
         self,
         mock_client_class: MagicMock,
@@ -60,7 +60,7 @@ class TestEmailNotificationIntegration:
 class TestSMSNotificationIntegration:
     """Integration tests for SMSNotificationService."""
 
-    @patch("lifetime_bot.notifications.sms.Client")
+    @patch("twilio.rest.Client")
     def test_sms_service_full_flow(
         self, mock_client_class: MagicMock, sms_config: SMSConfig
     ) -> None:
@@ -94,7 +94,7 @@ class TestSMSNotificationIntegration:
             to=sms_config.to_number,
         )
 
-    @patch("lifetime_bot.notifications.sms.Client")
+    @patch("twilio.rest.Client")
     def test_sms_service_with_different_configs(
         self, mock_client_class: MagicMock
     ) -> None:
@@ -174,7 +174,7 @@ class TestNotificationServiceInteraction:
         assert result is True
         mock_server.send_message.assert_called_once()
 
-    @patch("lifetime_bot.notifications.sms.Client")
+    @patch("twilio.rest.Client")
     def test_sms_service_can_send_independently(
         self,
         mock_client_class: MagicMock,
@@ -218,7 +218,7 @@ class TestNotificationServiceInteraction:
 
         assert result is False
 
-    @patch("lifetime_bot.notifications.sms.Client")
+    @patch("twilio.rest.Client")
     def test_sms_service_handles_twilio_error(
         self,
         mock_client_class: MagicMock,
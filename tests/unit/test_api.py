@@ -14,6 +14,7 @@ from lifetime_bot.api import (
     API_BASE,
     SUBSCRIPTION_KEY,
     LifetimeAPIClient,
+    create_http_session,
     match_class,
 )
 from lifetime_bot.errors import LifetimeAPIError
@@ -145,6 +146,18 @@ class TestClientHeaders:
         assert "x-ltf-ct" not in headers
 
 
+class TestCreateHttpSession:
+    def test_mounts_pooled_adapter_with_connect_only_retries(self) -> None:
+        session = create_http_session()
+        adapter = session.get_adapter(f"{API_BASE}/ux/web-schedules")
+
+        assert adapter._pool_maxsize == 20
+        retries = adapter.max_retries
+        assert retries.connect == 3
+        assert retries.read == 0
+        assert retries.status == 0
+
+
 class TestListClasses:
     def test_builds_correct_request(self) -> None:
         client, request_mock = _client_with_mock(_FakeResponse(payload={"results": []}))
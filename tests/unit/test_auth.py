@@ -56,6 +56,29 @@ class TestDirectAPIAuthenticator:
         session.post.assert_called_once()
         session.get.assert_called_once()
 
+    def test_relogin_reuses_session_without_stale_member_state(self) -> None:
+        session = MagicMock()
+        session.post.return_value = _response(
+            {"message": "Success", "status": "0", "token": "auth-token", "ssoId": "sso-id"}
+        )
+        session.get.return_value = _response(
+            {"jwt": "profile-jwt", "memberDetails": {"memberId": 110137193}}
+        )
+        session_factory = MagicMock(return_value=session)
+        authenticator = DirectAPIAuthenticator(
+            timeout=10.0,
+            session_factory=session_factory,
+        )
+
+        first = authenticator.login("user", "pass")
+        session.headers = {"X-LTF-JWE": "stale-token"}
+        second = authenticator.login("user", "pass")
+
+        session_factory.assert_called_once_with()
+        assert first.session is second.session is session
+        session.cookies.clear.assert_called_once_with()
+        assert "X-LTF-JWE" not in session.headers
+
     @pytest.mark.parametrize(
         ("login_payload", "profile_payload", "expected"),
         [
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import os
 from unittest.mock import MagicMock, patch
 
@@ -17,3 +18,80 @@ class TestMain:
             assert main_module.main() == 0
 
         run_bot.assert_called_once_with()
+
+    @patch("lifetime_bot.__main__.wait_until_utc")
+    @patch("lifetime_bot.__main__.run_bot")
+    @patch("lifetime_bot.__main__.is_valid_day", return_value=False)
+    def test_main_skips_scheduled_run_on_invalid_day(
+        self,
+        _is_valid_day: MagicMock,
+        run_bot: MagicMock,
+        wait_until_utc: MagicMock,
+        tmp_path,
+    ) -> None:
+        result_path = tmp_path / "result.json"
+        env = {"RUN_ON_SCHEDULE": "true", "LIFETIME_BOT_RESULT_PATH": str(result_path)}
+        with patch.dict(os.environ, env, clear=False):
+            assert main_module.main() == 0
+
+        run_bot.assert_not_called()
+        wait_until_utc.assert_not_called()
+        payload = json.loads(result_path.read_text())
+        assert payload["success"] is True
+        assert payload["outcome"] == "skipped"
+
+    @patch("lifetime_bot.__main__.get_target_utc_time", return_value="16:00:00")
+    @patch("lifetime_bot.__main__.is_valid_day", return_value=True)
+    @patch("lifetime_bot.__main__.run_bot", return_value=True)
+    @patch("lifetime_bot.__main__.wait_until_utc")
+    @patch("lifetime_bot.__main__.default_bot_factory")
+    def test_main_builds_bot_before_scheduled_wait(
+        self,
+        default_bot_factory: MagicMock,
+        wait_until_utc: MagicMock,
+        run_bot: MagicMock,
+        _is_valid_day: MagicMock,
+        _get_target_utc_time: MagicMock,
+    ) -> None:
+        create_bot = default_bot_factory.return_value
+
+        def _fire(_target: str, callback):
+            create_bot.assert_called_once_with()
+            return callback()
+
+        wait_until_utc.side_effect = _fire
+        with patch.dict(os.environ, {"RUN_ON_SCHEDULE": "true"}, clear=False):
+            assert main_module.main() == 0
+
+        bot_factory = run_bot.call_args.kwargs["bot_factory"]
+        assert bot_factory() is create_bot.return_value
+        create_bot.assert_called_once_with()
+
+    @patch("lifetime_bot.__main__.get_target_utc_time", return_value="16:00:00")
+    @patch("lifetime_bot.__main__.is_valid_day", return_value=True)
+    @patch("lifetime_bot.__main__.run_bot", return_value=True)
+    @patch("lifetime_bot.__main__.wait_until_utc")
+    @patch("lifetime_bot.__main__.default_bot_factory")
+    def test_main_logs_in_shortly_before_target(
+        self,
+        default_bot_factory: MagicMock,
+        wait_until_utc: MagicMock,
+        run_bot: MagicMock,
+        _is_valid_day: MagicMock,
+        _get_target_utc_time: MagicMock,
+    ) -> None:
+        bot = default_bot_factory.return_value.return_value
+        targets: list[str] = []
+
+        def _fire(target: str, callback):
+            targets.append(target)
+            if target == "16:00:00":
+                bot.prepare_session.assert_called_once_with()
+            return callback()
+
+        wait_until_utc.side_effect = _fire
+        with patch.dict(os.environ, {"RUN_ON_SCHEDULE": "true"}, clear=False):
+            assert main_module.main() == 0
+
+        assert targets == ["15:59:30", "16:00:00"]
+        run_bot.assert_called_once()
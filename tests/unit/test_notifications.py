@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import os
+import smtplib
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -67,6 +70,20 @@ class TestEmailNotificationService:
         )
         mock_server.send_message.assert_called_once()
 
+    @patch("lifetime_bot.notifications.email.smtplib.SMTP")
+    def test_send_builds_single_part_plain_text_message(
+        self, mock_smtp: MagicMock, email_config: EmailConfig
+    ) -> None:
+        mock_server = MagicMock()
+        mock_smtp.return_value.__enter__.return_value = mock_server
+
+        EmailNotificationService(email_config).send("Test Subject", "Test Message")
+
+        sent_message = mock_server.send_message.call_args.args[0]
+        assert not sent_message.is_multipart()
+        assert sent_message.get_content_type() == "text/plain"
+        assert sent_message.get_content().strip() == "Test Message"
+
     @patch("lifetime_bot.notifications.email.smtplib.SMTP")
     def test_send_uses_smtp_timeout_override(
         self, mock_smtp: MagicMock, email_config: EmailConfig
@@ -97,6 +114,123 @@ class TestEmailNotificationService:
 
         assert result is False
 
+    @patch("lifetime_bot.notifications.email.smtplib.SMTP")
+    def test_reuses_connection_until_closed(
+        self, mock_smtp: MagicMock, email_config: EmailConfig
+    ) -> None:
+        """Test the SMTP connection is pooled across sends and closed on demand."""
+        mock_server = MagicMock()
+        mock_smtp.return_value.__enter__.return_value = mock_server
+
+        service = EmailNotificationService(email_config)
+        assert service.send("First", "Message") is True
+        assert service.send("Second", "Message") is True
+
+        mock_smtp.assert_called_once()
+        mock_server.login.assert_called_once()
+        assert mock_server.send_message.call_count == 2
+        mock_smtp.return_value.__exit__.assert_not_called()
+
+        service.close()
+
+        mock_smtp.return_value.__exit__.assert_called_once()
+
+    @patch("lifetime_bot.notifications.email.smtplib.SMTP")
+    def test_close_does_not_wait_behind_stalled_send(
+        self, mock_smtp: MagicMock, email_config: EmailConfig
+    ) -> None:
+        """Test close returns at once while a send holds the connection."""
+        mock_server = MagicMock()
+        mock_smtp.return_value.__enter__.return_value = mock_server
+        sending = threading.Event()
+        release = threading.Event()
+
+        def _stalled_send(_msg: object) -> None:
+            sending.set()
+            release.wait(2.0)
+
+        mock_server.send_message.side_effect = _stalled_send
+        service = EmailNotificationService(email_config)
+        sender = threading.Thread(target=service.send, args=("Subject", "Message"))
+        sender.start()
+        assert sending.wait(1.0)
+
+        started = time.perf_counter()
+        service.close()
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.5
+        mock_smtp.return_value.__exit__.assert_not_called()
+        release.set()
+        sender.join(1.0)
+        mock_smtp.return_value.__exit__.assert_called_once()
+
+    @patch("lifetime_bot.notifications.email.atexit.register")
+    @patch("lifetime_bot.notifications.email.smtplib.SMTP")
+    def test_exit_hook_does_not_wait_behind_stalled_send(
+        self,
+        mock_smtp: MagicMock,
+        mock_register: MagicMock,
+        email_config: EmailConfig,
+    ) -> None:
+        """Test the interpreter-exit close skips a connection a send still holds."""
+        mock_server = MagicMock()
+        mock_smtp.return_value.__enter__.return_value = mock_server
+        sending = threading.Event()
+        release = threading.Event()
+
+        def _stalled_send(_msg: object) -> None:
+            sending.set()
+            release.wait(2.0)
+
+        mock_server.send_message.side_effect = _stalled_send
+        service = EmailNotificationService(email_config)
+        sender = threading.Thread(target=service.send, args=("Subject", "Message"), daemon=True)
+        sender.start()
+        assert sending.wait(1.0)
+        (exit_hook,) = mock_register.call_args.args
+
+        started = time.perf_counter()
+        exit_hook()
+
+        assert time.perf_counter() - started < 0.5
+        release.set()
+        sender.join(1.0)
+
+    @patch("lifetime_bot.notifications.email.smtplib.SMTP")
+    def test_reconnects_when_pooled_connection_drops(
+        self, mock_smtp: MagicMock, email_config: EmailConfig
+    ) -> None:
+        """Test a dropped idle connection is replaced transparently."""
+        stale_server = MagicMock()
+        fresh_server = MagicMock()
+        mock_smtp.return_value.__enter__.side_effect = [stale_server, fresh_server]
+
+        service = EmailNotificationService(email_config)
+        assert service.send("First", "Message") is True
+        stale_server.send_message.side_effect = smtplib.SMTPServerDisconnected()
+
+        assert service.send("Second", "Message") is True
+
+        assert mock_smtp.call_count == 2
+        fresh_server.send_message.assert_called_once()
+
+    @patch("lifetime_bot.notifications.email.smtplib.SMTP")
+    def test_reconnects_after_connection_reset(
+        self, mock_smtp: MagicMock, email_config: EmailConfig
+    ) -> None:
+        """Test a reset socket on the pooled connection also triggers a reconnect."""
+        stale_server = MagicMock()
+        fresh_server = MagicMock()
+        mock_smtp.return_value.__enter__.side_effect = [stale_server, fresh_server]
+
+        service = EmailNotificationService(email_config)
+        assert service.send("First", "Message") is True
+        stale_server.send_message.side_effect = ConnectionResetError("reset by peer")
+
+        assert service.send("Second", "Message") is True
+        fresh_server.send_message.assert_called_once()
+
     def test_send_not_configured(self) -> None:
         """Test send returns False when not configured."""
         config = EmailConfig(sender="", password="", receiver="")
@@ -140,7 +274,7 @@ class TestSMSNotificationService:
         service = SMSNotificationService(sms_config)
         assert service.is_configured() is False
 
-    @patch("lifetime_bot.notifications.sms.Client")
+    @patch("twilio.rest.Client")
     def test_send_success(
         self,
         mock_client_class: MagicMock,
@@ -163,7 +297,7 @@ class TestSMSNotificationService:
             to=sms_config.to_number,
         )
 
-    @patch("lifetime_bot.notifications.sms.Client")
+    @patch("twilio.rest.Client")
     def test_send_failure(
         self,
         mock_client_class: MagicMock,
@@ -191,7 +325,7 @@ class TestSMSNotificationService:
         result = service.send("Test Subject", "Test Message")
         assert result is False
 
-    @patch("lifetime_bot.notifications.sms.Client")
+    @patch("twilio.rest.Client")
     def test_send_message_format(
         self,
         mock_client_class: MagicMock,
@@ -208,3 +342,21 @@ class TestSMSNotificationService:
         assert call_args.kwargs["body"] == "Subject: Message body"
         assert call_args.kwargs["from_"] == sms_config.from_number
         assert call_args.kwargs["to"] == sms_config.to_number
+
+    @patch("twilio.rest.Client")
+    def test_reuses_client_across_sends(
+        self,
+        mock_client_class: MagicMock,
+        sms_config: SMSConfig,
+    ) -> None:
+        """Test the Twilio client is created lazily and only once."""
+        service = SMSNotificationService(sms_config)
+        mock_client_class.assert_not_called()
+
+        service.send("First", "Message")
+        service.send("Second", "Message")
+
+        mock_client_class.assert_called_once_with(
+            sms_config.account_sid, sms_config.auth_token
+        )
+        assert mock_client_class.return_value.messages.create.call_count == 2
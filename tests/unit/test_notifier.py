@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from unittest.mock import MagicMock
 
@@ -62,6 +63,29 @@ class TestNotificationCoordinator:
         sms.send.assert_called_once_with("subject", "body")
         assert [attempt.channel for attempt in result.attempts] == ["email", "sms"]
 
+    def test_both_channels_send_concurrently(
+        self, services: tuple[MagicMock, MagicMock]
+    ) -> None:
+        email, sms = services
+        barrier = threading.Barrier(2, timeout=1.0)
+
+        def _send_together(_subject: str, _body: str) -> bool:
+            barrier.wait()
+            return True
+
+        email.send.side_effect = _send_together
+        sms.send.side_effect = _send_together
+        coordinator = NotificationCoordinator(
+            email_service=email,
+            sms_service=sms,
+            timeout_seconds=2.0,
+        )
+
+        result = coordinator.send("subject", "body", method="both")
+
+        assert [attempt.channel for attempt in result.attempts] == ["email", "sms"]
+        assert all(attempt.succeeded for attempt in result.attempts)
+
     def test_timeout_does_not_block(
         self,
         services: tuple[MagicMock, MagicMock],
@@ -88,6 +112,32 @@ class TestNotificationCoordinator:
         assert "Notification phase started: subject" in captured
         assert "Email notification timed out after 0.01s: subject" in captured
 
+    def test_both_channels_share_one_timeout_window(
+        self, services: tuple[MagicMock, MagicMock]
+    ) -> None:
+        email, sms = services
+        release = threading.Event()
+
+        def _hang(_subject: str, _body: str) -> bool:
+            release.wait(1.0)
+            return True
+
+        email.send.side_effect = _hang
+        sms.send.side_effect = _hang
+        coordinator = NotificationCoordinator(
+            email_service=email,
+            sms_service=sms,
+            timeout_seconds=0.2,
+        )
+
+        started = time.perf_counter()
+        result = coordinator.send("subject", "body", method="both")
+        elapsed = time.perf_counter() - started
+        release.set()
+
+        assert [attempt.completed for attempt in result.attempts] == [False, False]
+        assert elapsed < 0.35
+
     def test_exception_is_reported(
         self,
         services: tuple[MagicMock, MagicMock],
@@ -106,3 +156,19 @@ class TestNotificationCoordinator:
         assert result.attempts[0].error == "RuntimeError: smtp exploded"
         captured = capsys.readouterr().out
         assert "Email notification failed: RuntimeError: smtp exploded" in captured
+
+    def test_close_releases_both_services(
+        self, services: tuple[MagicMock, MagicMock]
+    ) -> None:
+        email, sms = services
+        email.close.side_effect = RuntimeError("already closed")
+        coordinator = NotificationCoordinator(
+            email_service=email,
+            sms_service=sms,
+            timeout_seconds=0.1,
+        )
+
+        coordinator.close()
+
+        email.close.assert_called_once_with()
+        sms.close.assert_called_once_with()
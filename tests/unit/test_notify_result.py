@@ -54,6 +54,26 @@ class TestNotifyResult:
             "reserved body",
             method="email",
         )
+        notifier.close.assert_called_once_with()
+
+    def test_does_not_notify_for_skipped_run(self, tmp_path, monkeypatch) -> None:
+        payload_path = tmp_path / "result.json"
+        payload_path.write_text(
+            json.dumps(
+                {
+                    "subject": "Lifetime Bot - Skipped",
+                    "body": "No reservation was attempted.",
+                    "success": True,
+                    "outcome": "skipped",
+                }
+            )
+        )
+        create_notifier = MagicMock()
+        monkeypatch.setattr("lifetime_bot.notify_result.create_notifier", create_notifier)
+
+        assert main([str(payload_path)]) == 0
+
+        create_notifier.assert_not_called()
 
     def test_returns_usage_error_without_path(self) -> None:
         assert main([]) == 2
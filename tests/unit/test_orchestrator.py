@@ -6,9 +6,10 @@ import base64
 import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 from lifetime_bot.auth import AuthenticatedSession
 from lifetime_bot.config import BotConfig
@@ -181,6 +182,142 @@ class TestReserveClass:
             "Reservation flow core completed"
         )
 
+    def test_reuses_authenticated_session_across_attempts(
+        self, harness: BotHarness
+    ) -> None:
+        harness.reservation_service.reserve_event.return_value = _result(
+            RegistrationOutcome.RESERVED,
+            raw_status="reserved",
+        )
+        harness.bot.config.target_class.date = "2026-04-29"
+        harness.bot.config.run_on_schedule = False
+
+        harness.bot.reserve_class()
+        harness.bot.reserve_class()
+
+        harness.authenticator.login.assert_called_once()
+
+    def test_prepared_session_is_used_by_first_attempt(self, harness: BotHarness) -> None:
+        harness.reservation_service.reserve_event.return_value = _result(
+            RegistrationOutcome.RESERVED,
+            raw_status="reserved",
+        )
+        harness.bot.config.target_class.date = "2026-04-29"
+        harness.bot.config.run_on_schedule = False
+
+        harness.bot.prepare_session()
+        harness.bot.reserve_class()
+
+        harness.authenticator.login.assert_called_once()
+
+    def test_prepared_event_skips_lookup_on_first_attempt_only(
+        self, harness: BotHarness
+    ) -> None:
+        harness.reservation_service.find_target_event.return_value = MagicMock(
+            event_id="evt"
+        )
+        harness.reservation_service.reserve_event.side_effect = [
+            requests.Timeout("slow"),
+            _result(RegistrationOutcome.RESERVED, raw_status="reserved"),
+        ]
+        harness.bot.config.target_class.date = "2026-04-29"
+        harness.bot.config.run_on_schedule = False
+
+        harness.bot.prepare_session()
+        lookups_before_t0 = harness.reservation_service.find_target_event.call_count
+        with pytest.raises(ReservationAttemptError):
+            harness.bot.reserve_class()
+        lookups_at_t0 = harness.reservation_service.find_target_event.call_count
+        harness.bot.reserve_class()
+
+        assert (lookups_before_t0, lookups_at_t0) == (1, 1)
+        assert harness.reservation_service.find_target_event.call_count == 2
+        harness.reservation_service.reserve_event.assert_called_with("evt")
+
+    def test_failed_prelookup_searches_again_at_first_attempt(
+        self, harness: BotHarness
+    ) -> None:
+        harness.reservation_service.find_target_event.side_effect = [
+            None,
+            MagicMock(event_id="evt"),
+        ]
+        harness.reservation_service.reserve_event.return_value = _result(
+            RegistrationOutcome.RESERVED,
+            raw_status="reserved",
+        )
+        harness.bot.config.target_class.date = "2026-04-29"
+        harness.bot.config.run_on_schedule = False
+
+        harness.bot.prepare_session()
+        harness.bot.reserve_class()
+
+        assert harness.reservation_service.find_target_event.call_count == 2
+        harness.reservation_service.reserve_event.assert_called_once_with("evt")
+
+    def test_failed_prepare_leaves_login_to_first_attempt(
+        self, harness: BotHarness
+    ) -> None:
+        harness.authenticator.login.side_effect = [
+            RuntimeError("auth down"),
+            harness.authenticator.login.return_value,
+        ]
+        harness.reservation_service.reserve_event.return_value = _result(
+            RegistrationOutcome.RESERVED,
+            raw_status="reserved",
+        )
+        harness.bot.config.target_class.date = "2026-04-29"
+        harness.bot.config.run_on_schedule = False
+
+        harness.bot.prepare_session()
+        harness.bot.reserve_class()
+
+        assert harness.authenticator.login.call_count == 2
+
+    def test_retries_keep_the_first_resolved_target_date(
+        self, harness: BotHarness
+    ) -> None:
+        harness.reservation_service.find_target_event.side_effect = [
+            requests.Timeout("slow"),
+            MagicMock(event_id="evt"),
+        ]
+        harness.reservation_service.reserve_event.return_value = _result(
+            RegistrationOutcome.RESERVED,
+            raw_status="reserved",
+        )
+        harness.bot.config.run_on_schedule = True
+
+        with patch(
+            "lifetime_bot.orchestrator.get_target_date",
+            side_effect=["2026-04-29", "2026-04-30"],
+        ):
+            with pytest.raises(ReservationAttemptError):
+                harness.bot.reserve_class()
+            harness.bot.reserve_class()
+
+        dates = [
+            call.kwargs["target_date"]
+            for call in harness.reservation_service.find_target_event.call_args_list
+        ]
+        assert dates == ["2026-04-29", "2026-04-29"]
+
+    def test_logs_in_again_after_session_is_rejected(self, harness: BotHarness) -> None:
+        harness.reservation_service.find_target_event.side_effect = [
+            LifetimeAPIError("GET returned 401", status_code=401),
+            MagicMock(event_id="evt"),
+        ]
+        harness.reservation_service.reserve_event.return_value = _result(
+            RegistrationOutcome.RESERVED,
+            raw_status="reserved",
+        )
+        harness.bot.config.target_class.date = "2026-04-29"
+        harness.bot.config.run_on_schedule = False
+
+        with pytest.raises(ReservationAttemptError):
+            harness.bot.reserve_class()
+        harness.bot.reserve_class()
+
+        assert harness.authenticator.login.call_count == 2
+
 
 class TestReserveClassFailures:
     def test_wraps_login_failure_without_notifying(self, harness: BotHarness) -> None:
@@ -234,3 +371,20 @@ class TestReserveClassFailures:
 
         assert subject == "Lifetime Bot - Login Failed"
         assert "Error (RuntimeError): login broke" in body
+
+
+class TestClose:
+    def test_closes_member_session_and_notifier(self, harness: BotHarness) -> None:
+        harness.bot.prepare_session()
+        session = harness.authenticator.login.return_value.session
+
+        harness.bot.close()
+
+        session.close.assert_called_once_with()
+        harness.notifier.close.assert_called_once_with()
+
+    def test_close_without_login_only_closes_notifier(self, harness: BotHarness) -> None:
+        harness.bot.close()
+
+        harness.authenticator.login.return_value.session.close.assert_not_called()
+        harness.notifier.close.assert_called_once_with()
@@ -55,6 +55,30 @@ class TestParseClassEvents:
         assert event.start == datetime(2026, 4, 29, 19, 0)
         assert event.end == datetime(2026, 4, 29, 21, 0)
 
+    def test_skips_other_days_when_date_given(self) -> None:
+        def day(day_iso: str, event_id: str) -> dict[str, object]:
+            return {
+                "day": day_iso,
+                "dayParts": [
+                    {
+                        "startTimes": [
+                            {
+                                "time": "7:00 PM",
+                                "activities": [
+                                    {"id": event_id, "name": "GTX", "endTime": "8:00 PM"}
+                                ],
+                            }
+                        ]
+                    }
+                ],
+            }
+
+        payload = {"results": [day("2026-04-28", "tue"), day("2026-04-29", "wed")]}
+
+        events = parse_class_events(payload, date_iso="2026-04-29")
+
+        assert [event.event_id for event in events] == ["wed"]
+
 
 class TestParseRegistrationResult:
     def test_parses_pending_registration_and_documents(self) -> None:
@@ -157,3 +181,79 @@ class TestMatchClass:
         )
 
         assert match is None
+
+    def test_unlisted_instructor_fallback_in_one_pass(self) -> None:
+        start = datetime(2026, 4, 29, 19, 0, tzinfo=timezone.utc)
+        unlisted = self._event(name="Yoga", instructor="", start=start, end=None)
+        listed = self._event(name="Yoga", instructor="Zack W.", start=start, end=None)
+
+        assert (
+            match_class(
+                [unlisted, listed],
+                name_contains="Yoga",
+                instructor_contains="Zack",
+                allow_unlisted_instructor=True,
+            )
+            is listed
+        )
+        assert (
+            match_class(
+                [unlisted],
+                name_contains="Yoga",
+                instructor_contains="Zack",
+                allow_unlisted_instructor=True,
+            )
+            is unlisted
+        )
+        assert (
+            match_class([unlisted], name_contains="Yoga", instructor_contains="Zack")
+            is None
+        )
+        other = self._event(name="Yoga", instructor="Sam K.", start=start, end=None)
+        assert (
+            match_class(
+                [other, unlisted],
+                name_contains="Yoga",
+                instructor_contains="Zack",
+                allow_unlisted_instructor=True,
+            )
+            is None
+        )
+
+    def test_time_filters_require_display_format(self) -> None:
+        events = [
+            self._event(
+                name="Yoga",
+                instructor="",
+                start=datetime(2026, 4, 29, 0, 30, tzinfo=timezone.utc),
+                end=datetime(2026, 4, 29, 12, 0, tzinfo=timezone.utc),
+            )
+        ]
+
+        assert (
+            match_class(
+                events,
+                name_contains="Yoga",
+                start_time_local="12:30 AM",
+                end_time_local="12:00 PM",
+            )
+            is not None
+        )
+        for start_time in ("00:30 AM", "12:30 am", "12:30"):
+            assert (
+                match_class(events, name_contains="Yoga", start_time_local=start_time)
+                is None
+            )
+
+    def test_rejects_on_date_mismatch_or_invalid_date(self) -> None:
+        events = [
+            self._event(
+                name="Pickleball Open Play: All Levels",
+                instructor="",
+                start=datetime(2026, 4, 29, 19, 0, tzinfo=timezone.utc),
+                end=datetime(2026, 4, 29, 21, 0, tzinfo=timezone.utc),
+            )
+        ]
+
+        assert match_class(events, name_contains="Pickleball", date_iso="2026-04-30") is None
+        assert match_class(events, name_contains="Pickleball", date_iso="not-a-date") is None
@@ -10,7 +10,11 @@ import pytest
 from lifetime_bot.config import ClassConfig
 from lifetime_bot.errors import LifetimeAPIError
 from lifetime_bot.models import ClassEvent, RegistrationOutcome, RegistrationResult
-from lifetime_bot.reservations import ReservationService
+from lifetime_bot.reservations import (
+    CONFIRMATION_WINDOW_SECONDS,
+    POST_COMPLETE_CONFIRMATION_ATTEMPTS,
+    ReservationService,
+)
 
 
 def _target_class(
@@ -56,6 +60,7 @@ class TestReservationServiceFindTargetEvent:
         assert kwargs["location"] == "San Antonio 281"
         assert kwargs["start"] == datetime(2026, 4, 26)
         assert kwargs["end"] == datetime(2026, 5, 3)
+        assert kwargs["date_iso"] == "2026-04-29"
 
     def test_rejects_invalid_date(self) -> None:
         with pytest.raises(LifetimeAPIError):
@@ -176,6 +181,30 @@ class TestReservationServiceReserveEvent:
             101, accepted_documents=[77]
         )
 
+    def test_reuses_preflight_documents_without_refetching(self) -> None:
+        client = MagicMock()
+        client.member_id = 110137193
+        client.get_registration_info.side_effect = [
+            {"registeredMembers": [], "agreement": {"agreementId": 77}},
+            {"registeredMembers": [{"id": 110137193, "name": "Tyler"}]},
+        ]
+        client.register.return_value = RegistrationResult(
+            registration_id=101,
+            outcome=RegistrationOutcome.PENDING_COMPLETION,
+            raw_status="pending",
+            needs_complete=True,
+            required_documents=None,
+            raw={},
+        )
+
+        result = ReservationService(client).reserve_event("evt")
+
+        assert result.outcome is RegistrationOutcome.RESERVED
+        client.complete_registration.assert_called_once_with(
+            101, accepted_documents=[77]
+        )
+        assert client.get_registration_info.call_count == 2
+
     def test_returns_waitlisted_result_without_completion(self) -> None:
         client = MagicMock()
         client.get_registration_info.side_effect = LifetimeAPIError(
@@ -432,3 +461,54 @@ class TestReservationServiceReserveEvent:
             accepted_documents=[77],
         )
         sleep.assert_called_once_with(0.5)
+
+    def test_backs_off_between_post_complete_verification_retries(self) -> None:
+        client = MagicMock()
+        client.member_id = 110137193
+        sleep = MagicMock()
+        pending = {"registeredMembers": [], "unregisteredMembers": []}
+        client.get_registration_info.side_effect = [
+            LifetimeAPIError("not found", status_code=404),
+            pending,
+            pending,
+            pending,
+            pending,
+            {"registeredMembers": [{"id": 110137193, "name": "Tyler"}]},
+        ]
+        client.register.return_value = RegistrationResult(
+            registration_id=101,
+            outcome=RegistrationOutcome.PENDING_COMPLETION,
+            raw_status="pending",
+            needs_complete=True,
+            required_documents=(77,),
+            raw={"regId": 101, "regStatus": "pending"},
+        )
+
+        result = ReservationService(client, sleep=sleep).reserve_event("evt")
+
+        assert result.outcome is RegistrationOutcome.RESERVED
+        assert [call.args[0] for call in sleep.call_args_list] == [0.5, 1.0, 2.0, 2.0]
+
+    def test_default_post_complete_verification_keeps_full_window(self) -> None:
+        client = MagicMock()
+        client.member_id = 110137193
+        sleep = MagicMock()
+        pending = {"registeredMembers": [], "unregisteredMembers": []}
+        client.get_registration_info.side_effect = [
+            LifetimeAPIError("not found", status_code=404),
+        ] + [pending] * POST_COMPLETE_CONFIRMATION_ATTEMPTS
+        client.register.return_value = RegistrationResult(
+            registration_id=101,
+            outcome=RegistrationOutcome.PENDING_COMPLETION,
+            raw_status="pending",
+            needs_complete=True,
+            required_documents=(77,),
+            raw={"regId": 101, "regStatus": "pending"},
+        )
+
+        with pytest.raises(LifetimeAPIError, match="did not confirm"):
+            ReservationService(client, sleep=sleep).reserve_event("evt")
+
+        slept = sum(call.args[0] for call in sleep.call_args_list)
+        assert slept >= CONFIRMATION_WINDOW_SECONDS
+        assert sleep.call_count == POST_COMPLETE_CONFIRMATION_ATTEMPTS - 1
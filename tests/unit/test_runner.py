@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import json
-from unittest.mock import MagicMock
+import threading
+import time
+from unittest.mock import MagicMock, patch
 
+import pytest
 import requests
 
 from lifetime_bot import runner
+from lifetime_bot.config import BotConfig, EmailConfig
 from lifetime_bot.errors import LifetimeAPIError, ReservationAttemptError
 from lifetime_bot.models import RegistrationOutcome, RegistrationResult
+from lifetime_bot.notifications import EmailNotificationService
+from lifetime_bot.notifier import NotificationCoordinator
+from lifetime_bot.orchestrator import ReservationOrchestrator
 
 
 def _result(outcome: RegistrationOutcome) -> RegistrationResult:
@@ -23,6 +30,32 @@ def _result(outcome: RegistrationOutcome) -> RegistrationResult:
     )
 
 
+class TestDefaultBotFactory:
+    def test_builds_one_bot_for_all_attempts(self, monkeypatch) -> None:
+        from_env = MagicMock()
+        create_bot = MagicMock()
+        monkeypatch.setattr(runner.BotConfig, "from_env", from_env)
+        monkeypatch.setattr(runner, "create_bot", create_bot)
+
+        factory = runner.default_bot_factory()
+
+        assert factory() is factory() is create_bot.return_value
+        from_env.assert_called_once_with()
+        create_bot.assert_called_once_with(from_env.return_value)
+
+    def test_retries_construction_after_failure(self, monkeypatch) -> None:
+        from_env = MagicMock(side_effect=[ValueError("missing club"), MagicMock()])
+        create_bot = MagicMock()
+        monkeypatch.setattr(runner.BotConfig, "from_env", from_env)
+        monkeypatch.setattr(runner, "create_bot", create_bot)
+
+        factory = runner.default_bot_factory()
+
+        with pytest.raises(ValueError, match="missing club"):
+            factory()
+        assert factory() is create_bot.return_value
+
+
 class TestRunBot:
     def test_stops_after_first_success(self) -> None:
         bot = MagicMock()
@@ -139,6 +172,66 @@ class TestRunBot:
         assert subject == "Lifetime Bot - All Attempts Failed"
         assert body == "Failed to reserve class after 2 attempts.\n\nfailure body"
 
+    def test_closes_each_bot_once_after_the_run(self) -> None:
+        bot = MagicMock()
+        bot.reserve_class.side_effect = [
+            requests.Timeout("slow"),
+            _result(RegistrationOutcome.RESERVED),
+        ]
+        bot.build_outcome_notification.return_value = ("subject", "body")
+
+        assert (
+            runner.run_bot(
+                bot_factory=lambda: bot,
+                max_retries=3,
+                retry_delay=0.0,
+                sleep=MagicMock(),
+            )
+            is True
+        )
+
+        bot.close.assert_called_once_with()
+
+    def test_close_errors_do_not_change_the_result(self) -> None:
+        bot = MagicMock()
+        bot.reserve_class.side_effect = LifetimeAPIError("bad", status_code=400)
+        bot.build_failure_notification.return_value = ("subject", "body")
+        bot.close.side_effect = RuntimeError("close broke")
+
+        assert (
+            runner.run_bot(bot_factory=lambda: bot, max_retries=1, sleep=MagicMock())
+            is False
+        )
+
+        bot.close.assert_called_once_with()
+
+    def test_retry_delay_doubles_up_to_the_cap(self) -> None:
+        bot = MagicMock()
+        bot.reserve_class.side_effect = requests.ConnectionError("down")
+        bot.build_failure_notification.return_value = (
+            "Lifetime Bot - Failure",
+            "failure body",
+        )
+        sleep = MagicMock()
+
+        assert (
+            runner.run_bot(
+                bot_factory=lambda: bot,
+                max_retries=5,
+                retry_delay=1.0,
+                max_retry_delay=3.0,
+                sleep=sleep,
+            )
+            is False
+        )
+
+        assert [call.args[0] for call in sleep.call_args_list] == [
+            1.0,
+            2.0,
+            3.0,
+            3.0,
+        ]
+
     def test_does_not_retry_non_retryable_api_errors(self) -> None:
         bot = MagicMock()
         bot.reserve_class.side_effect = LifetimeAPIError(
@@ -255,3 +348,128 @@ class TestRunBot:
         assert payload["error_phase"] == "reservation"
         assert payload["error_type"] == "LifetimeAPIError"
         assert payload["error_message"] == "downstream boom"
+
+
+class TestRunBotSessionRecovery:
+    def _bot(self, bot_config: BotConfig) -> tuple[ReservationOrchestrator, MagicMock, MagicMock]:
+        bot_config.target_class.date = "2026-04-29"
+        authenticator = MagicMock()
+        reservation_service = MagicMock()
+        bot = ReservationOrchestrator(
+            bot_config,
+            authenticator=authenticator,
+            notifier=MagicMock(),
+            reservation_service_factory=MagicMock(return_value=reservation_service),
+        )
+        return bot, authenticator, reservation_service
+
+    def test_rejected_session_is_retried_with_fresh_login(
+        self, bot_config: BotConfig
+    ) -> None:
+        bot, authenticator, reservation_service = self._bot(bot_config)
+        reservation_service.find_target_event.return_value = MagicMock(event_id="evt")
+        reservation_service.reserve_event.side_effect = [
+            LifetimeAPIError("POST returned 401", status_code=401),
+            _result(RegistrationOutcome.RESERVED),
+        ]
+        sleep = MagicMock()
+
+        assert (
+            runner.run_bot(
+                bot_factory=lambda: bot,
+                max_retries=3,
+                retry_delay=1.0,
+                sleep=sleep,
+            )
+            is True
+        )
+
+        assert authenticator.login.call_count == 2
+        assert reservation_service.reserve_event.call_count == 2
+        sleep.assert_called_once_with(1.0)
+
+    def test_rejected_login_is_not_retried(self, bot_config: BotConfig) -> None:
+        bot, authenticator, _ = self._bot(bot_config)
+        authenticator.login.side_effect = LifetimeAPIError(
+            "auth/v2/login returned 401", status_code=401
+        )
+        sleep = MagicMock()
+
+        assert (
+            runner.run_bot(
+                bot_factory=lambda: bot,
+                max_retries=3,
+                retry_delay=1.0,
+                sleep=sleep,
+            )
+            is False
+        )
+
+        authenticator.login.assert_called_once()
+        sleep.assert_not_called()
+
+    def test_session_prepared_before_target_time_recovers_when_rejected(
+        self, bot_config: BotConfig
+    ) -> None:
+        bot, authenticator, reservation_service = self._bot(bot_config)
+        reservation_service.find_target_event.return_value = MagicMock(event_id="evt")
+        reservation_service.reserve_event.side_effect = [
+            LifetimeAPIError("POST returned 401", status_code=401),
+            _result(RegistrationOutcome.RESERVED),
+        ]
+        sleep = MagicMock()
+
+        bot.prepare_session()
+
+        assert (
+            runner.run_bot(
+                bot_factory=lambda: bot,
+                max_retries=3,
+                retry_delay=1.0,
+                sleep=sleep,
+            )
+            is True
+        )
+
+        assert authenticator.login.call_count == 2
+        assert reservation_service.find_target_event.call_count == 2
+        sleep.assert_called_once_with(1.0)
+
+
+class TestRunBotClose:
+    @patch("lifetime_bot.notifications.email.atexit.register")
+    @patch("lifetime_bot.notifications.email.smtplib.SMTP")
+    def test_timed_out_notification_does_not_hold_up_the_run(
+        self,
+        mock_smtp: MagicMock,
+        _mock_register: MagicMock,
+        bot_config: BotConfig,
+        email_config: EmailConfig,
+    ) -> None:
+        release = threading.Event()
+        mock_smtp.return_value.__enter__.return_value.send_message.side_effect = (
+            lambda _msg: release.wait(3.0)
+        )
+        bot_config.target_class.date = "2026-04-29"
+        reservation_service = MagicMock()
+        reservation_service.find_target_event.return_value = MagicMock(event_id="evt")
+        reservation_service.reserve_event.return_value = _result(RegistrationOutcome.RESERVED)
+        bot = ReservationOrchestrator(
+            bot_config,
+            authenticator=MagicMock(),
+            notifier=NotificationCoordinator(
+                email_service=EmailNotificationService(email_config),
+                sms_service=MagicMock(),
+                timeout_seconds=0.2,
+            ),
+            reservation_service_factory=MagicMock(return_value=reservation_service),
+        )
+
+        started = time.perf_counter()
+        try:
+            assert runner.run_bot(bot_factory=lambda: bot, max_retries=1) is True
+            elapsed = time.perf_counter() - started
+        finally:
+            release.set()
+
+        assert elapsed < 1.5
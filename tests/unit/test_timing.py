@@ -6,6 +6,7 @@ import datetime
 from unittest.mock import MagicMock, patch
 
 from lifetime_bot.utils.timing import (
+    get_lead_utc_time,
     get_target_date,
     get_target_utc_time,
     is_valid_day,
@@ -118,6 +119,36 @@ class TestGetTargetUtcTime:
         assert result == "18:00:00"
 
 
+class TestGetLeadUtcTime:
+    """Tests for get_lead_utc_time function."""
+
+    def test_subtracts_lead(self) -> None:
+        assert get_lead_utc_time("16:00:00", 30) == "15:59:30"
+
+    def test_clamps_to_midnight_instead_of_wrapping(self) -> None:
+        assert get_lead_utc_time("00:00:10", 30) == "00:00:00"
+
+    @patch("lifetime_bot.utils.timing.time.sleep")
+    @patch("lifetime_bot.utils.timing.datetime")
+    def test_clamped_lead_runs_immediately_after_midnight(
+        self, mock_datetime: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """A start between midnight and a just-after-midnight target must not sleep a day."""
+        mock_datetime.datetime.now.return_value = datetime.datetime(
+            2026, 4, 26, 0, 0, 5, tzinfo=datetime.timezone.utc
+        )
+        mock_datetime.datetime.strptime = datetime.datetime.strptime
+        mock_datetime.datetime.combine = datetime.datetime.combine
+        mock_datetime.timedelta = datetime.timedelta
+        mock_datetime.timezone = datetime.timezone
+        callback = MagicMock(return_value="done")
+
+        lead_time = get_lead_utc_time("00:00:10", 30)
+
+        assert wait_until_utc(lead_time, callback) == "done"
+        mock_sleep.assert_not_called()
+
+
 class TestIsValidDay:
     """Tests for is_valid_day function."""
 
@@ -187,26 +218,27 @@ class TestWaitUntilUtc:
         )
         mock_datetime.timezone = datetime.timezone
 
-        callback = MagicMock()
-        wait_until_utc("16:00:00", callback)
+        callback = MagicMock(return_value=True)
+        assert wait_until_utc("16:00:00", callback) is True
 
         mock_sleep.assert_not_called()
         callback.assert_called_once()
 
+    @patch("lifetime_bot.utils.timing.time.monotonic")
     @patch("lifetime_bot.utils.timing.time.sleep")
     @patch("lifetime_bot.utils.timing.datetime")
     def test_sleeps_until_target_time(
-        self, mock_datetime: MagicMock, mock_sleep: MagicMock
+        self, mock_datetime: MagicMock, mock_sleep: MagicMock, mock_monotonic: MagicMock
     ) -> None:
-        """Test that function sleeps until target time."""
-        # Current time is 15:00 UTC, target is 16:00 UTC (1 hour = 3600 seconds)
-        mock_now = datetime.datetime(
-            2026, 1, 15, 15, 0, 0, tzinfo=datetime.timezone.utc
-        )
-        mock_target = datetime.datetime(
-            2026, 1, 15, 16, 0, 0, tzinfo=datetime.timezone.utc
-        )
-        mock_datetime.datetime.now.return_value = mock_now
+        """Test chunked sleeps, then a monotonic final approach to the target."""
+        utc = datetime.timezone.utc
+        mock_target = datetime.datetime(2026, 1, 15, 16, 0, 0, tzinfo=utc)
+        mock_datetime.datetime.now.side_effect = [
+            datetime.datetime(2026, 1, 15, 15, 0, 0, tzinfo=utc),
+            datetime.datetime(2026, 1, 15, 15, 0, 0, tzinfo=utc),
+            datetime.datetime(2026, 1, 15, 15, 59, 30, tzinfo=utc),
+        ]
+        mock_monotonic.side_effect = [100.0, 129.7, 130.0]
         mock_datetime.datetime.strptime.return_value = datetime.datetime(
             1900, 1, 1, 16, 0, 0
         )
@@ -216,7 +248,11 @@ class TestWaitUntilUtc:
         callback = MagicMock()
         wait_until_utc("16:00:00", callback)
 
-        mock_sleep.assert_called_once_with(3600.0)
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [
+            30.0,
+            29.5,
+            0.001,
+        ]
         callback.assert_called_once()
 
     @patch("lifetime_bot.utils.timing.time.sleep")